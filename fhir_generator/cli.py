@@ -5,9 +5,12 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Any, Iterable, Iterator, List, Tuple
 
+from .generators.utils import dumps_json, loads_json, write_json
 from .main import FHIRDataGenerator
 
 LOGGER = logging.getLogger(__name__)
@@ -33,6 +36,21 @@ def build_parser() -> argparse.ArgumentParser:
     dataset_parser.add_argument("--output", type=Path, default=Path("output"), help="Directory to store output")
     dataset_parser.add_argument("--seed", type=int, help="Seed for deterministic output")
     dataset_parser.add_argument("--csv", action="store_true", help="Export CSV summary as well")
+    layout_group = dataset_parser.add_mutually_exclusive_group()
+    layout_group.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Write all resources to a single resources.ndjson instead of per-patient folders",
+    )
+    layout_group.add_argument(
+        "--archive",
+        action="store_true",
+        help="Write patient folders and bundles into a single dataset.zip",
+    )
+    dataset_parser.add_argument("--pretty", action="store_true", help="Indent exported JSON files (compact by default)")
+    dataset_parser.add_argument(
+        "--workers", type=int, default=1, help="Worker processes used for generation (0 uses every CPU)"
+    )
 
     bundle_parser = subparsers.add_parser("bundle", help="Create a bundle for previously generated resources")
     bundle_parser.add_argument("--input", type=Path, required=True, help="Directory containing patient folders")
@@ -42,20 +60,56 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _read_resources(file: Path) -> List[Any]:
+    if file.suffix == ".ndjson":
+        resources: List[Any] = []
+        with file.open("rb") as handle:
+            for line_number, line in enumerate(handle, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    resources.append(loads_json(line))
+                except json.JSONDecodeError:
+                    LOGGER.error("Skipping invalid JSON on line %d of %s", line_number, file)
+        return resources
+
+    try:
+        return [loads_json(file.read_bytes())]
+    except json.JSONDecodeError:
+        LOGGER.error("Skipping invalid JSON file %s", file)
+        return []
+
+
 def load_resources_from_dir(path: Path) -> List[dict]:
-    """Load non-bundle JSON resources from a directory tree."""
+    """Load non-bundle JSON and NDJSON resources from a directory tree.
+
+    Files are read concurrently to overlap disk latency; results keep the
+    sorted path order.
+    """
+
+    files = sorted([*path.glob("**/*.json"), *path.glob("**/*.ndjson")])
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        loaded = list(executor.map(_read_resources, files))
+
+    return [
+        resource
+        for resources in loaded
+        for resource in resources
+        if isinstance(resource, dict) and resource.get("resourceType") != "Bundle"
+    ]
 
-    resources: List[dict] = []
-    for file in sorted(path.glob("**/*.json")):
-        try:
-            with file.open() as handle:
-                resource = json.load(handle)
-        except json.JSONDecodeError:
-            LOGGER.error("Skipping invalid JSON file %s", file)
-            continue
-        if isinstance(resource, dict) and resource.get("resourceType") != "Bundle":
-            resources.append(resource)
-    return resources
+
+def _collect_summary_rows(
+    generator: FHIRDataGenerator, dataset: Iterable[List[dict]], rows: List[Tuple[Any, ...]]
+) -> Iterator[List[dict]]:
+    """Pass patients through unchanged while recording their CSV summary rows."""
+
+    for resources in dataset:
+        row = generator.summary_row(resources)
+        if row is not None:
+            rows.append(row)
+        yield resources
 
 
 def main(argv: List[str] | None = None) -> None:
@@ -71,25 +125,35 @@ def main(argv: List[str] | None = None) -> None:
             generator = FHIRDataGenerator(seed=args.seed)
             resources = generator.generate_patient_resources()
             patient = next(res for res in resources if res.get("resourceType") == "Patient")
-            output = json.dumps(patient, indent=2)
             if args.output:
                 args.output.parent.mkdir(parents=True, exist_ok=True)
-                args.output.write_text(output)
+                write_json(args.output, patient)
                 LOGGER.info("Wrote patient to %s", args.output)
             else:
-                print(output)
+                print(dumps_json(patient).decode("utf-8"))
             return
 
         if args.command == "create-dataset":
             if args.count < 1:
                 parser.error("--count must be at least 1")
+            if args.workers < 0:
+                parser.error("--workers must not be negative")
 
             generator = FHIRDataGenerator(seed=args.seed)
-            dataset = generator.generate_dataset(args.count)
-            generator.export_dataset(dataset, args.output)
+            dataset: Iterable[List[dict]] = generator.iter_dataset(args.count, workers=args.workers or None)
+
+            summary_rows: List[Tuple[Any, ...]] = []
+            if args.csv:
+                dataset = _collect_summary_rows(generator, dataset, summary_rows)
+
+            if args.ndjson:
+                generator.export_ndjson(dataset, args.output / "resources.ndjson")
+            elif args.archive:
+                generator.export_dataset_archive(dataset, args.output / "dataset.zip", pretty=args.pretty)
+            else:
+                generator.export_dataset(dataset, args.output, pretty=args.pretty)
             if args.csv:
-                csv_path = args.output / "summary.csv"
-                generator.export_csv_summary(dataset, csv_path)
+                generator.write_csv_summary(summary_rows, args.output / "summary.csv")
             return
 
         if args.command == "bundle":
@@ -97,7 +161,7 @@ def main(argv: List[str] | None = None) -> None:
             generator = FHIRDataGenerator()
             bundle = generator.bundle(resources)
             args.output.parent.mkdir(parents=True, exist_ok=True)
-            args.output.write_text(json.dumps(bundle, indent=2))
+            write_json(args.output, bundle, atomic=True)
             LOGGER.info("Wrote bundle to %s", args.output)
             return
     except Exception as exc:  # pragma: no cover - defensive top-level catch
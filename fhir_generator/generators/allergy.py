@@ -7,13 +7,14 @@ from typing import Any, Dict
 
 from faker import Faker
 
-from .utils import build_reference, coded_text, new_uuid
+from .utils import ALLERGY_CLINICAL_ACTIVE, ALLERGY_VERIF_CONFIRMED, build_reference, coded_text, new_uuid
 
-ALLERGENS = [
+ALLERGENS = (
     ("http://snomed.info/sct", "91935009", "Peanut"),
     ("http://snomed.info/sct", "235719002", "Penicillin"),
     ("http://snomed.info/sct", "300916003", "Latex"),
-]
+)
+_SEVERITIES = ("mild", "moderate", "severe")
 
 
 def create_allergy_intolerance(fake: Faker, patient_id: str) -> Dict[str, Any]:
@@ -25,18 +26,14 @@ def create_allergy_intolerance(fake: Faker, patient_id: str) -> Dict[str, Any]:
     return {
         "resourceType": "AllergyIntolerance",
         "id": allergy_id,
-        "clinicalStatus": coded_text(
-            "http://terminology.hl7.org/CodeSystem/allergyintolerance-clinical", "active", "Active"
-        ),
-        "verificationStatus": coded_text(
-            "http://terminology.hl7.org/CodeSystem/allergyintolerance-verification", "confirmed", "Confirmed"
-        ),
+        "clinicalStatus": ALLERGY_CLINICAL_ACTIVE,
+        "verificationStatus": ALLERGY_VERIF_CONFIRMED,
         "code": coded_text(system, code, display),
         "patient": build_reference("Patient", patient_id),
         "reaction": [
             {
                 "manifestation": [coded_text("http://snomed.info/sct", "271807003", "Rash")],
-                "severity": random.choice(["mild", "moderate", "severe"]),
+                "severity": random.choice(_SEVERITIES),
             }
         ],
     }
@@ -2,19 +2,18 @@
 
 from __future__ import annotations
 
-import datetime as dt
 import random
 from typing import Any, Dict, List
 
 from faker import Faker
 
-from .utils import build_reference, coded_text, new_uuid
+from .utils import batch_now_iso, build_reference, coded_text, new_uuid
 
-REPORT_CODES = [
+REPORT_CODES = (
     ("http://loinc.org", "58410-2", "Complete blood count"),
     ("http://loinc.org", "24323-8", "Lipid panel"),
     ("http://loinc.org", "2093-3", "Cholesterol"),
-]
+)
 
 
 def create_diagnostic_report(
@@ -24,7 +23,7 @@ def create_diagnostic_report(
 
     code_system, code, display = random.choice(REPORT_CODES)
     report_id = new_uuid()
-    issued = dt.datetime.now(dt.timezone.utc).isoformat()
+    issued = batch_now_iso()
 
     return {
         "resourceType": "DiagnosticReport",
@@ -8,14 +8,14 @@ from typing import Any, Dict
 
 from faker import Faker
 
-from .utils import CODING_SYSTEMS, build_period, build_reference, coded_text, new_uuid
+from .utils import CODED_CONCEPTS, build_period, build_reference, new_uuid
 
 
 def create_encounter(fake: Faker, patient_id: str, practitioner_id: str | None = None) -> Dict[str, Any]:
     """Create an Encounter tied to a patient and optional practitioner."""
 
     encounter_id = new_uuid()
-    encounter_code = random.choice(CODING_SYSTEMS["encounter"])
+    encounter_type = random.choice(CODED_CONCEPTS["encounter"])
     start = fake.date_time_between(start_date="-2y", end_date="now", tzinfo=dt.timezone.utc)
     period = build_period(start, hours=random.randint(1, 72))
 
@@ -27,8 +27,8 @@ def create_encounter(fake: Faker, patient_id: str, practitioner_id: str | None =
         "resourceType": "Encounter",
         "id": encounter_id,
         "status": "finished",
-        "class": encounter_code,
-        "type": [coded_text(**encounter_code)],
+        "class": encounter_type["coding"][0],
+        "type": [encounter_type],
         "subject": build_reference("Patient", patient_id),
         "participant": participants,
         "period": period,
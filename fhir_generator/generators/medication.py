@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-import datetime as dt
 import random
 from typing import Any, Dict
 
 from faker import Faker
 
-from .utils import CODING_SYSTEMS, build_reference, coded_text, new_uuid
+from .utils import CODED_CONCEPTS, batch_now_iso, build_reference, new_uuid
+
+# Shared between requests like the cached CodeableConcepts; do not mutate.
+_DOSAGE_INSTRUCTIONS = tuple(
+    [{"sequence": 1, "text": f"Take {tablets} tablet(s) by mouth daily"}] for tablets in (1, 2)
+)
 
 
 def create_medication_request(
@@ -16,24 +20,19 @@ def create_medication_request(
 ) -> Dict[str, Any]:
     """Create a MedicationRequest ordering a common therapy."""
 
-    med_code = random.choice(CODING_SYSTEMS["medications"])
+    med_code = random.choice(CODED_CONCEPTS["medications"])
     request_id = new_uuid()
-    authored_on = dt.datetime.now(dt.timezone.utc).isoformat()
+    authored_on = batch_now_iso()
 
     medication_request = {
         "resourceType": "MedicationRequest",
         "id": request_id,
         "status": "active",
         "intent": "order",
-        "medicationCodeableConcept": coded_text(**med_code),
+        "medicationCodeableConcept": med_code,
         "subject": build_reference("Patient", patient_id),
         "authoredOn": authored_on,
-        "dosageInstruction": [
-            {
-                "sequence": 1,
-                "text": f"Take {random.randint(1, 2)} tablet(s) by mouth daily",
-            }
-        ],
+        "dosageInstruction": random.choice(_DOSAGE_INSTRUCTIONS),
     }
 
     if practitioner_id:
@@ -3,12 +3,38 @@
 from __future__ import annotations
 
 import datetime as dt
+import itertools
+import random
+import string
 from typing import Any, Dict
 
 from faker import Faker
 
 from .utils import new_uuid, random_ethnicity, random_gender, random_location, weight_height_for_age
 
+_MRN_LETTERS = string.ascii_letters
+# MRNs keep the ``??#####`` shape, so the numeric part wraps after 99999.
+_MRN_MODULUS = 100_000
+_mrn_counter = itertools.count()
+
+
+def reset_mrn_counter(start: int = 0) -> None:
+    """Restart MRN numbering at ``start``; parallel workers use disjoint ranges."""
+
+    global _mrn_counter
+    _mrn_counter = itertools.count(start)
+
+
+def next_mrn() -> str:
+    """Return a medical record number such as ``Qx00042``.
+
+    The numeric part counts up from the last :func:`reset_mrn_counter` call
+    (seeding a generator restarts it), so numbers are unique within the first
+    100,000 patients of a seeded run and then wrap to keep seven characters.
+    """
+
+    return f"{random.choice(_MRN_LETTERS)}{random.choice(_MRN_LETTERS)}{next(_mrn_counter) % _MRN_MODULUS:05d}"
+
 
 def create_patient(fake: Faker) -> Dict[str, Any]:
     """Create a Patient resource with realistic demographic signals."""
@@ -26,7 +52,7 @@ def create_patient(fake: Faker) -> Dict[str, Any]:
             {
                 "use": "official",
                 "system": "http://hospital.smarthealth.org/mrn",
-                "value": fake.unique.bothify(text="??#####"),
+                "value": next_mrn(),
             }
         ],
         "name": [
@@ -2,13 +2,29 @@
 
 from __future__ import annotations
 
+import bisect
+import contextlib
 import datetime as dt
+import functools
+import itertools
+import json
+import os
 import random
-import uuid
-from typing import Any, Dict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from faker import Faker
 
+try:  # Optional accelerator for batched vital-sign sampling
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy installed
+    np = None
+
+try:  # Optional accelerator for JSON encoding/decoding
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None
+
 CODING_SYSTEMS = {
     "gender": {
         "male": {"system": "http://hl7.org/fhir/administrative-gender", "code": "male", "display": "Male"},
@@ -49,10 +65,103 @@ CODING_SYSTEMS = {
 }
 
 
+_UUID_BATCH = 4096
+_UUID_VERSION = bytes((byte & 0x0F) | 0x40 for byte in range(256))
+_UUID_VARIANT = bytes((byte & 0x3F) | 0x80 for byte in range(256))
+_UUID_POOL = ""
+_UUID_POS = 0
+
+
+def _refill_uuid_pool() -> None:
+    global _UUID_POOL, _UUID_POS
+    raw = bytearray(os.urandom(16 * _UUID_BATCH))
+    raw[6::16] = raw[6::16].translate(_UUID_VERSION)
+    raw[8::16] = raw[8::16].translate(_UUID_VARIANT)
+    _UUID_POOL = raw.hex()
+    _UUID_POS = len(_UUID_POOL)
+
+
 def new_uuid() -> str:
-    """Return a new UUID4 string."""
+    """Return a new UUID4 string.
+
+    Random bytes are drawn from ``os.urandom`` in batches of ``_UUID_BATCH``
+    identifiers, stamped with the version and variant bits and hex-encoded
+    once per batch, so each call only slices and formats a string.
+    """
+
+    global _UUID_POS
+    if not _UUID_POS:
+        _refill_uuid_pool()
+    _UUID_POS -= 32
+    h = _UUID_POOL[_UUID_POS : _UUID_POS + 32]
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _reset_uuid_pool() -> None:
+    global _UUID_POOL, _UUID_POS
+    _UUID_POOL, _UUID_POS = "", 0
+
+
+if hasattr(os, "register_at_fork"):
+    # Forked workers must not hand out the parent's pending identifiers.
+    os.register_at_fork(after_in_child=_reset_uuid_pool)
+
+
+def loads_json(data: bytes | str) -> Any:
+    """Parse JSON text, using orjson when it is installed.
+
+    Raises:
+        json.JSONDecodeError: if ``data`` is not valid JSON.
+    """
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(obj: Any, pretty: bool = True) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON, indented by two spaces unless ``pretty`` is False."""
+
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2) if pretty else orjson.dumps(obj)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+# Large sequential writes (bundles, NDJSON) go through one 1 MiB buffer.
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def write_json(path: Path, obj: Any, atomic: bool = False, pretty: bool = True) -> None:
+    """Serialize ``obj`` once and write it to ``path`` through a single buffered handle.
+
+    Args:
+        path: Destination file.
+        obj: JSON-serializable payload.
+        atomic: Write to a sibling temporary file and rename it over ``path`` so
+            readers never observe a partially written document. No fsync is issued.
+        pretty: Indent by two spaces; ``False`` writes compact JSON.
+    """
+
+    payload = dumps_json(obj, pretty=pretty)
+    target = path.with_name(f"{path.name}.tmp") if atomic else path
+    with open(target, "wb", buffering=WRITE_BUFFER_SIZE) as handle:
+        handle.write(payload)
+    if atomic:
+        os.replace(target, path)
+
+
+def fsync_directory(path: Path) -> None:
+    """Flush directory entry updates (creates and renames) under ``path`` to disk once."""
 
-    return str(uuid.uuid4())
+    if os.name != "posix":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
 
 def build_reference(resource_type: str, resource_id: str) -> Dict[str, str]:
@@ -61,17 +170,57 @@ def build_reference(resource_type: str, resource_id: str) -> Dict[str, str]:
     return {"reference": f"{resource_type}/{resource_id}"}
 
 
+@functools.lru_cache(maxsize=None)
+def _coded_text_cached(system: str, code: str, display: str) -> Dict[str, Any]:
+    return {"coding": [{"system": system, "code": code, "display": display}], "text": display}
+
+
 def coded_text(system: str, code: str, display: str) -> Dict[str, Any]:
-    """Return a CodeableConcept dictionary."""
+    """Return a CodeableConcept dictionary.
 
-    return {"coding": [{"system": system, "code": code, "display": display}], "text": display}
+    Concepts are cached per ``(system, code, display)`` and shared between
+    resources, so callers must copy the result before mutating it.
+    """
+
+    return _coded_text_cached(system, code, display)
+
+
+def coded_text_from(coding: Dict[str, str]) -> Dict[str, Any]:
+    """Return the cached CodeableConcept for a ``{system, code, display}`` coding dict."""
+
+    return _coded_text_cached(coding["system"], coding["code"], coding["display"])
+
+
+CODED_CONCEPTS = {
+    key: tuple(coded_text_from(coding) for coding in CODING_SYSTEMS[key])
+    for key in ("encounter", "conditions", "medications", "procedures")
+}
+OBSERVATION_CONCEPTS = {key: coded_text_from(coding) for key, coding in CODING_SYSTEMS["observations"].items()}
+
+CONDITION_CLINICAL_ACTIVE = coded_text("http://terminology.hl7.org/CodeSystem/condition-clinical", "active", "Active")
+CONDITION_VERIF_CONFIRMED = coded_text(
+    "http://terminology.hl7.org/CodeSystem/condition-ver-status", "confirmed", "Confirmed"
+)
+ALLERGY_CLINICAL_ACTIVE = coded_text(
+    "http://terminology.hl7.org/CodeSystem/allergyintolerance-clinical", "active", "Active"
+)
+ALLERGY_VERIF_CONFIRMED = coded_text(
+    "http://terminology.hl7.org/CodeSystem/allergyintolerance-verification", "confirmed", "Confirmed"
+)
+SYSTOLIC_BP_CONCEPT = coded_text("http://loinc.org", "8480-6", "Systolic blood pressure")
+DIASTOLIC_BP_CONCEPT = coded_text("http://loinc.org", "8462-4", "Diastolic blood pressure")
+CATEGORY_VITAL_SIGNS = coded_text(
+    "http://terminology.hl7.org/CodeSystem/observation-category", "vital-signs", "Vital Signs"
+)
+
+
+_GENDERS = tuple(CODING_SYSTEMS["gender"].values())
 
 
 def random_gender(fake: Faker) -> Dict[str, Any]:
     """Return a gender coding drawn from HL7 administrative gender values."""
 
-    gender = random.choice(list(CODING_SYSTEMS["gender"].values()))
-    return gender
+    return random.choice(_GENDERS)
 
 
 def build_period(start: dt.datetime, hours: int = 1) -> Dict[str, str]:
@@ -92,6 +241,68 @@ def weight_height_for_age(age: int) -> Dict[str, float]:
     }
 
 
+@functools.lru_cache(maxsize=None)
+def shared_faker(locale: str = "en_US") -> Faker:
+    """Return the process-wide Faker for ``locale``, building it on first use.
+
+    Constructing Faker loads every provider for the locale, so generators share
+    one instance per process; seeding it affects every holder.
+    """
+
+    return Faker(locale)
+
+
+class PooledFaker:
+    """Faker proxy that recycles values from hot demographic providers.
+
+    The first ``pool_size`` calls to each pooled provider are served by Faker and
+    remembered; later calls pick one of the remembered values, skipping Faker's
+    provider dispatch. Every other attribute is forwarded to the wrapped instance.
+    """
+
+    POOLED_PROVIDERS = (
+        "first_name",
+        "last_name",
+        "company",
+        "street_address",
+        "city",
+        "state_abbr",
+        "postcode",
+        "phone_number",
+        "email",
+    )
+
+    def __init__(self, faker: Faker, pool_size: int = 1024) -> None:
+        self.faker = faker
+        self.pool_size = pool_size
+        self._pools: Dict[str, List[str]] = {}
+        for provider in self.POOLED_PROVIDERS:
+            setattr(self, provider, self._pooled(provider))
+
+    def _pooled(self, provider: str) -> Callable[[], str]:
+        pool = self._pools.setdefault(provider, [])
+        source = getattr(self.faker, provider)
+
+        def draw() -> str:
+            if len(pool) < self.pool_size:
+                value = source()
+                pool.append(value)
+                return value
+            return random.choice(pool)
+
+        return draw
+
+    def seed_instance(self, seed: Any = None) -> None:
+        """Reseed the wrapped Faker and forget previously pooled values."""
+
+        for pool in self._pools.values():
+            pool.clear()
+        self.faker.seed_instance(seed)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.faker, name)
+
+
 def random_practitioner(fake: Faker) -> Dict[str, Any]:
     """Create a practitioner identity with a plausible qualification."""
 
@@ -110,7 +321,7 @@ def random_practitioner(fake: Faker) -> Dict[str, Any]:
                 "identifier": [
                     {
                         "system": "http://hl7.org/fhir/sid/us-npi",
-                        "value": fake.bothify(text="#######"),
+                        "value": f"{random.randrange(10_000_000):07d}",
                     }
                 ],
                 "code": coded_text(
@@ -123,15 +334,16 @@ def random_practitioner(fake: Faker) -> Dict[str, Any]:
     }
 
 
+_ETHNICITIES = (
+    coded_text("urn:oid:2.16.840.1.113883.6.238", "2135-2", "Hispanic or Latino"),
+    coded_text("urn:oid:2.16.840.1.113883.6.238", "2186-5", "Not Hispanic or Latino"),
+)
+
+
 def random_ethnicity(fake: Faker) -> Dict[str, Any]:
     """Return a randomized US-core ethnicity CodeableConcept."""
 
-    values = [
-        ("2135-2", "Hispanic or Latino"),
-        ("2186-5", "Not Hispanic or Latino"),
-    ]
-    code, display = random.choice(values)
-    return coded_text("urn:oid:2.16.840.1.113883.6.238", code, display)
+    return random.choice(_ETHNICITIES)
 
 
 def random_location(fake: Faker) -> Dict[str, str]:
@@ -145,46 +357,182 @@ def random_location(fake: Faker) -> Dict[str, str]:
     }
 
 
-def observation_value(observation_type: str) -> Dict[str, Any]:
-    """Generate structured observation values based on the requested type."""
-
-    if observation_type == "blood_pressure":
-        systolic = int(random.gauss(120, 15))
-        diastolic = int(random.gauss(80, 10))
-        return {
-            "component": [
-                {
-                    "code": coded_text("http://loinc.org", "8480-6", "Systolic blood pressure"),
-                    "valueQuantity": {"value": systolic, "unit": "mmHg"},
-                },
-                {
-                    "code": coded_text("http://loinc.org", "8462-4", "Diastolic blood pressure"),
-                    "valueQuantity": {"value": diastolic, "unit": "mmHg"},
-                },
-            ]
-        }
-    if observation_type == "heart_rate":
-        return {"valueQuantity": {"value": int(random.gauss(72, 8)), "unit": "beats/min"}}
-    if observation_type == "temperature":
-        return {"valueQuantity": {"value": round(random.gauss(98.6, 0.7), 1), "unit": "F"}}
-    if observation_type == "glucose":
-        return {"valueQuantity": {"value": round(random.gauss(100, 25), 1), "unit": "mg/dL"}}
-    if observation_type == "cholesterol":
-        return {"valueQuantity": {"value": round(random.gauss(190, 35), 1), "unit": "mg/dL"}}
-    if observation_type == "spo2":
-        return {"valueQuantity": {"value": round(random.gauss(97, 2), 1), "unit": "%"}}
-    return {"valueString": "Synthetic observation"}
+VITAL_DISTRIBUTIONS: Dict[str, Tuple[Tuple[float, float], ...]] = {
+    "blood_pressure": ((120, 15), (80, 10)),
+    "heart_rate": ((72, 8),),
+    "temperature": ((98.6, 0.7),),
+    "glucose": ((100, 25),),
+    "cholesterol": ((190, 35),),
+    "spo2": ((97, 2),),
+}
+
+
+def sample_vitals(observation_type: str) -> Tuple[float, ...]:
+    """Draw the raw Gaussian values backing a single observation."""
+
+    return tuple(random.gauss(mean, sd) for mean, sd in VITAL_DISTRIBUTIONS.get(observation_type, ()))
+
+
+class PresampledVitals:
+    """Gaussian vital-sign draws precomputed for a batch of patients.
+
+    Draws come from a NumPy generator when NumPy is installed and fall back to
+    a :class:`random.Random` otherwise; either way they depend only on ``seed``.
+    """
+
+    def __init__(self, count: int, seed: Optional[int] = None) -> None:
+        self._slices: Dict[str, slice] = {}
+        params: List[Tuple[float, float]] = []
+        for observation_type, distributions in VITAL_DISTRIBUTIONS.items():
+            self._slices[observation_type] = slice(len(params), len(params) + len(distributions))
+            params.extend(distributions)
+
+        if np is None:
+            gauss = random.Random(seed).gauss
+            self._rows = [[gauss(mean, sd) for mean, sd in params] for _ in range(count)]
+            return
+
+        # One broadcast draw fills the whole (count, draws-per-patient) block.
+        means, sds = zip(*params)
+        rng = np.random.default_rng(seed)
+        self._rows = rng.normal(means, sds, size=(count, len(params))).tolist()
+
+    def for_patient(self, index: int) -> Dict[str, Tuple[float, ...]]:
+        """Return the draws reserved for the patient at ``index``."""
+
+        row = self._rows[index]
+        return {observation_type: tuple(row[span]) for observation_type, span in self._slices.items()}
+
+
+def _round1(value: float) -> float:
+    return round(value, 1)
+
+
+# Unit and rounding rule for every single-quantity observation type.
+_QUANTITY_FORMATS: Dict[str, Tuple[str, Callable[[float], float]]] = {
+    "heart_rate": ("beats/min", int),
+    "temperature": ("F", _round1),
+    "glucose": ("mg/dL", _round1),
+    "cholesterol": ("mg/dL", _round1),
+    "spo2": ("%", _round1),
+}
+
+
+def observation_value(observation_type: str, draws: Optional[Sequence[float]] = None) -> Dict[str, Any]:
+    """Generate structured observation values based on the requested type.
+
+    Args:
+        observation_type: Key from ``VITAL_DISTRIBUTIONS``.
+        draws: Optional presampled Gaussian values; sampled on demand when omitted.
+    """
+
+    if observation_type not in VITAL_DISTRIBUTIONS:
+        return {"valueString": "Synthetic observation"}
+    if draws is None:
+        draws = sample_vitals(observation_type)
+
+    quantity_format = _QUANTITY_FORMATS.get(observation_type)
+    if quantity_format is not None:
+        unit, convert = quantity_format
+        return {"valueQuantity": {"value": convert(draws[0]), "unit": unit}}
+
+    return {
+        "component": [
+            {
+                "code": SYSTOLIC_BP_CONCEPT,
+                "valueQuantity": {"value": int(draws[0]), "unit": "mmHg"},
+            },
+            {
+                "code": DIASTOLIC_BP_CONCEPT,
+                "valueQuantity": {"value": int(draws[1]), "unit": "mmHg"},
+            },
+        ]
+    }
+
+
+_FROZEN_NOW: Optional[Tuple[dt.datetime, str]] = None
+
+
+@contextlib.contextmanager
+def freeze_now() -> Iterator[dt.datetime]:
+    """Pin ``batch_now``/``batch_now_iso`` to a single instant for the block.
+
+    Nested blocks keep the outermost timestamp.
+    """
+
+    global _FROZEN_NOW
+    if _FROZEN_NOW is not None:
+        yield _FROZEN_NOW[0]
+        return
+
+    now = dt.datetime.now(dt.timezone.utc)
+    _FROZEN_NOW = (now, now.isoformat())
+    try:
+        yield now
+    finally:
+        _FROZEN_NOW = None
+
+
+def batch_now() -> dt.datetime:
+    """Return the frozen UTC timestamp, or the current time outside ``freeze_now``."""
+
+    if _FROZEN_NOW is not None:
+        return _FROZEN_NOW[0]
+    return dt.datetime.now(dt.timezone.utc)
+
+
+def batch_now_iso() -> str:
+    """Return :func:`batch_now` as an ISO 8601 string without reformatting frozen values."""
+
+    if _FROZEN_NOW is not None:
+        return _FROZEN_NOW[1]
+    return dt.datetime.now(dt.timezone.utc).isoformat()
 
 
 def current_period(hours: int = 1) -> Dict[str, str]:
-    """Return a period anchored to now with the given duration in hours."""
+    """Return a period anchored to now with the given duration in hours.
+
+    Inside :func:`freeze_now` the start reuses the already formatted timestamp.
+    """
+
+    if _FROZEN_NOW is None:
+        return build_period(dt.datetime.now(dt.timezone.utc), hours=hours)
+    start, start_iso = _FROZEN_NOW
+    return {"start": start_iso, "end": (start + dt.timedelta(hours=hours)).isoformat()}
+
 
-    start = dt.datetime.now(dt.timezone.utc)
-    return build_period(start, hours=hours)
+class WeightedPicker:
+    """Reusable roulette-wheel selector over a static weight mapping.
+
+    Cumulative weights are computed once so each :meth:`pick` is a single
+    binary search instead of a walk over the mapping.
+    """
+
+    def __init__(self, values: Dict[Any, float]) -> None:
+        if not values:
+            msg = "WeightedPicker requires at least one weighted value"
+            raise ValueError(msg)
+        self.keys = tuple(values)
+        self.cum = list(itertools.accumulate(values.values()))
+        self.total = self.cum[-1]
+
+    def pick(self) -> Any:
+        """Select a key with probability proportional to its weight.
+
+        Matches :func:`pick_weighted` draw for draw, including returning the
+        first key when every weight is zero.
+        """
+
+        index = bisect.bisect_left(self.cum, random.uniform(0, self.total))
+        return self.keys[min(index, len(self.keys) - 1)]
 
 
 def pick_weighted(values: Dict[Any, float]) -> Any:
-    """Select a key from a weight mapping using roulette-wheel selection."""
+    """Select a key from a weight mapping using roulette-wheel selection.
+
+    Callers drawing repeatedly from the same mapping should hold a
+    :class:`WeightedPicker` instead; for a single draw this walk is cheaper.
+    """
 
     total = sum(values.values())
     rand = random.uniform(0, total)
@@ -10,13 +10,17 @@ integration tests and analytics sandboxes.
 from __future__ import annotations
 
 import csv
-import json
+import itertools
 import logging
+import os
 import random
+import shutil
+import tempfile
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
-
-from faker import Faker
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from .generators.allergy import create_allergy_intolerance
 from .generators.condition import create_condition
@@ -24,13 +28,89 @@ from .generators.diagnostic_report import create_diagnostic_report
 from .generators.encounter import create_encounter
 from .generators.medication import create_medication_request
 from .generators.observation import OBSERVATION_TYPES, create_observation
-from .generators.patient import create_patient
+from .generators.patient import create_patient, reset_mrn_counter
 from .generators.procedure import create_procedure
-from .generators.utils import new_uuid, random_practitioner
-from .validators.fhir_validator import validate_resource
+from .generators.utils import (
+    WRITE_BUFFER_SIZE,
+    PooledFaker,
+    PresampledVitals,
+    dumps_json,
+    freeze_now,
+    fsync_directory,
+    new_uuid,
+    random_practitioner,
+    shared_faker,
+    write_json,
+)
+from .validators.fhir_validator import RESOURCE_TYPES_LOWER, validate_resource
 
 LOGGER = logging.getLogger(__name__)
 
+# Shared read-only default for chained ``.get`` lookups; never mutated.
+_EMPTY: Dict = {}
+
+CSV_SUMMARY_FIELDS = (
+    "patient_id",
+    "birth_date",
+    "gender",
+    "encounter_type",
+    "heart_rate",
+    "blood_pressure_systolic",
+)
+
+
+# Patients whose vital signs are presampled together in the serial path.
+VITALS_BLOCK_SIZE = 1024
+
+PARALLEL_MIN_COUNT = 4
+# Patients per worker task, and tasks kept in flight per worker; together they
+# cap how many finished patients can wait for a slow consumer.
+PARALLEL_CHUNK_SIZE = 8
+PARALLEL_TASKS_PER_WORKER = 2
+
+_WORKER_GENERATOR: Optional[FHIRDataGenerator] = None
+
+
+def _generate_one(seed: int, locale: str, mrn_start: int) -> List[Dict]:
+    """Worker entry point generating one independently seeded patient.
+
+    Each worker process keeps one generator and reseeds it per patient, so a
+    patient's output depends only on its seed, not on which worker ran it.
+    Reseeding per patient would empty :class:`PooledFaker` pools before they
+    ever fill, so workers call Faker directly and draw vitals from the seeded
+    :mod:`random` stream instead of building a NumPy generator per patient.
+    """
+
+    global _WORKER_GENERATOR
+    if _WORKER_GENERATOR is None or _WORKER_GENERATOR.locale != locale:
+        _WORKER_GENERATOR = FHIRDataGenerator(locale=locale)
+        _WORKER_GENERATOR.fake = shared_faker(locale)
+    generator = _WORKER_GENERATOR
+
+    random.seed(seed)
+    generator.fake.seed_instance(seed)
+    reset_mrn_counter(mrn_start)
+    return generator.generate_patient_resources()
+
+
+def _generate_chunk(seeds: Sequence[int], locale: str, mrn_start: int) -> List[List[Dict]]:
+    """Worker entry point generating consecutive patients in one task."""
+
+    return [_generate_one(seed, locale, mrn_start + offset) for offset, seed in enumerate(seeds)]
+
+
+# Practitioner has no REQUIRED_FIELDS entry but is exported for every patient.
+_FILENAME_PREFIXES = {resource_type: f"{lower}_" for resource_type, lower in RESOURCE_TYPES_LOWER.items()}
+_FILENAME_PREFIXES["Practitioner"] = "practitioner_"
+
+
+def resource_filename(resource: Dict) -> str:
+    """Return the export file name for a validated resource."""
+
+    resource_type = resource["resourceType"]
+    prefix = _FILENAME_PREFIXES.get(resource_type) or f"{resource_type.lower()}_"
+    return f"{prefix}{resource['id']}.json"
+
 
 class FHIRDataGenerator:
     """Synthetic HL7 FHIR resource generator."""
@@ -43,37 +123,60 @@ class FHIRDataGenerator:
             locale: Faker locale string used for demographic fields.
         """
 
-        self.fake = Faker(locale)
+        self.fake = PooledFaker(shared_faker(locale))
+        self.locale = locale
         self.seed = seed
         self.set_seed(seed)
 
     def set_seed(self, seed: Optional[int]) -> None:
-        """Seed Python and Faker RNGs when a value is provided."""
+        """Seed Python and Faker RNGs when a value is provided.
+
+        The MRN counter restarts too, so equal seeds yield identical patients.
+        """
 
         if seed is not None:
             random.seed(seed)
             self.fake.seed_instance(seed)
+            reset_mrn_counter()
             LOGGER.info("Seed set to %s", seed)
 
-    def generate_patient_resources(self) -> List[Dict]:
-        """Generate a cohesive set of resources linked to a single patient."""
-
-        practitioner = random_practitioner(self.fake)
-        patient = create_patient(self.fake)
-        encounter = create_encounter(self.fake, patient["id"], practitioner_id=practitioner["id"])
-        observations = [create_observation(self.fake, patient["id"], encounter["id"], obs) for obs in OBSERVATION_TYPES]
-        condition = create_condition(self.fake, patient["id"], encounter_id=encounter["id"])
-        procedure = create_procedure(self.fake, patient["id"], encounter["id"])
-        medication_request = create_medication_request(
-            self.fake, patient["id"], practitioner_id=practitioner["id"], encounter_id=encounter["id"]
-        )
-        diagnostic_report = create_diagnostic_report(
-            self.fake,
-            patient_id=patient["id"],
-            encounter_id=encounter["id"],
-            observation_ids=[obs["id"] for obs in observations],
-        )
-        allergy = create_allergy_intolerance(self.fake, patient["id"])
+    def generate_patient_resources(self, vitals: Optional[Dict[str, Sequence[float]]] = None) -> List[Dict]:
+        """Generate a cohesive set of resources linked to a single patient.
+
+        All timestamps derived from "now" share one instant per patient.
+
+        Args:
+            vitals: Optional presampled draws per observation type, as produced by
+                :meth:`PresampledVitals.for_patient`.
+        """
+
+        vitals = vitals or {}
+
+        fake = self.fake
+        vitals_get = vitals.get
+        with freeze_now():
+            practitioner = random_practitioner(fake)
+            practitioner_id = practitioner["id"]
+            patient = create_patient(fake)
+            patient_id = patient["id"]
+            encounter = create_encounter(fake, patient_id, practitioner_id=practitioner_id)
+            encounter_id = encounter["id"]
+            observations = [
+                create_observation(fake, patient_id, encounter_id, obs, draws=vitals_get(obs))
+                for obs in OBSERVATION_TYPES
+            ]
+            condition = create_condition(fake, patient_id, encounter_id=encounter_id)
+            procedure = create_procedure(fake, patient_id, encounter_id)
+            medication_request = create_medication_request(
+                fake, patient_id, practitioner_id=practitioner_id, encounter_id=encounter_id
+            )
+            diagnostic_report = create_diagnostic_report(
+                fake,
+                patient_id=patient_id,
+                encounter_id=encounter_id,
+                observation_ids=[obs["id"] for obs in observations],
+            )
+            allergy = create_allergy_intolerance(fake, patient_id)
 
         resources: List[Dict] = [
             practitioner,
@@ -87,109 +190,328 @@ class FHIRDataGenerator:
             *observations,
         ]
 
-        LOGGER.debug("Generated %d resources for patient %s", len(resources), patient["id"])
+        LOGGER.debug("Generated %d resources for patient %s", len(resources), patient_id)
         return resources
 
-    def generate_dataset(self, count: int) -> List[List[Dict]]:
+    def generate_dataset(self, count: int, workers: Optional[int] = 1) -> List[List[Dict]]:
         """Generate multiple patient resource collections.
 
+        See :meth:`iter_dataset` for the meaning of ``workers``.
+
         Raises:
             ValueError: if ``count`` is less than 1.
         """
 
+        return list(self.iter_dataset(count, workers=workers))
+
+    def iter_dataset(self, count: int, workers: Optional[int] = 1) -> Iterator[List[Dict]]:
+        """Lazily yield one patient's resources at a time.
+
+        Only a single patient's resources are alive at once (with workers, at
+        most ``PARALLEL_TASKS_PER_WORKER`` chunks of ``PARALLEL_CHUNK_SIZE``
+        patients per worker), so callers that export as they iterate keep peak
+        memory independent of ``count``.
+
+        Args:
+            count: Number of patients to generate.
+            workers: Worker processes to spread patients across; ``None`` uses
+                every CPU. With more than one worker (and at least
+                ``PARALLEL_MIN_COUNT`` patients) patient ``i`` is generated from
+                its own seed ``base + i``, where ``base`` is drawn from the seeded
+                stream, so seeded output is independent of the worker count but
+                differs from the single-process sequence.
+
+        Raises:
+            ValueError: if ``count`` is less than 1 (raised immediately).
+        """
+
         if count < 1:
             msg = "Count must be at least 1"
             raise ValueError(msg)
 
+        workers = min(workers or os.cpu_count() or 1, count)
+        if workers > 1 and count >= PARALLEL_MIN_COUNT:
+            LOGGER.info("Generating dataset with %d patients across %d workers", count, workers)
+            return self._iter_parallel(count, workers)
+
         LOGGER.info("Generating dataset with %d patients", count)
-        return [self.generate_patient_resources() for _ in range(count)]
+        return self._iter_serial(count)
+
+    def _iter_serial(self, count: int) -> Iterator[List[Dict]]:
+        for block_start in range(0, count, VITALS_BLOCK_SIZE):
+            block_size = min(VITALS_BLOCK_SIZE, count - block_start)
+            # Each block's seed comes from the running stream so repeated calls continue it.
+            vitals = PresampledVitals(block_size, seed=random.randrange(2**32))
+            for idx in range(block_size):
+                yield self.generate_patient_resources(vitals=vitals.for_patient(idx))
+
+    def _iter_parallel(self, count: int, workers: int) -> Iterator[List[Dict]]:
+        # Patient seeds come from the seeded stream, so repeated calls and
+        # set_seed() behave as in the serial path; forked workers never touch it.
+        base = random.randrange(2**32)
+        seeds = [base + idx for idx in range(count)]
+
+        # Submit chunks through a bounded window rather than executor.map, which
+        # queues every task up front and lets results pile up behind the consumer.
+        starts = iter(range(0, count, PARALLEL_CHUNK_SIZE))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+
+            def submit(start: int) -> Future:
+                return executor.submit(_generate_chunk, seeds[start : start + PARALLEL_CHUNK_SIZE], self.locale, start)
+
+            pending = deque(map(submit, itertools.islice(starts, workers * PARALLEL_TASKS_PER_WORKER)))
+            while pending:
+                chunk = pending.popleft().result()
+                start = next(starts, None)
+                if start is not None:
+                    pending.append(submit(start))
+                yield from chunk
 
     @staticmethod
     def bundle(resources: Iterable[Dict], bundle_type: str = "collection") -> Dict:
         """Wrap a list of resources in a FHIR Bundle structure."""
 
-        entries = [
-            {
-                "fullUrl": f"urn:uuid:{res.get('id', new_uuid())}",
-                "resource": res,
-            }
-            for res in resources
-        ]
+        entries = list(FHIRDataGenerator._iter_entries(resources))
         return {"resourceType": "Bundle", "type": bundle_type, "entry": entries}
 
-    def export_patient_folder(self, resources: List[Dict], output_dir: Path) -> None:
-        """Persist a single patient's resources and bundle to disk."""
+    @staticmethod
+    def _iter_entries(resources: Iterable[Dict]) -> Iterator[Dict]:
+        """Yield Bundle entries, minting a UUID only for resources without an id."""
+
+        for res in resources:
+            yield {"fullUrl": f"urn:uuid:{res.get('id') or new_uuid()}", "resource": res}
 
-        output_dir.mkdir(parents=True, exist_ok=True)
+    @staticmethod
+    def _write_bundle_entries(
+        handle: BinaryIO, resources: Iterable[Dict], bundle_type: str = "collection", pretty: bool = False
+    ) -> None:
+        """Write :meth:`bundle` output for ``resources`` to ``handle`` entry by entry.
+
+        The bytes match ``dumps_json(bundle(resources), pretty=pretty)`` but neither
+        the bundle dict nor the full document is ever held in memory.
+        """
+
+        if pretty:
+            open_type, open_entries, first, separator, close = (
+                b'{\n  "resourceType": "Bundle",\n  "type": ',
+                b',\n  "entry": [',
+                b"\n    ",
+                b",\n    ",
+                b"\n  ]\n}",
+            )
+        else:
+            open_type, open_entries, first, separator, close = (
+                b'{"resourceType":"Bundle","type":',
+                b',"entry":[',
+                b"",
+                b",",
+                b"]}",
+            )
+
+        handle.write(open_type)
+        handle.write(dumps_json(bundle_type))
+        handle.write(open_entries)
+        prefix = first
+        for entry in FHIRDataGenerator._iter_entries(resources):
+            handle.write(prefix)
+            payload = dumps_json(entry, pretty=pretty)
+            handle.write(payload.replace(b"\n", b"\n    ") if pretty else payload)
+            prefix = separator
+        # An empty pretty bundle is rendered as "entry": [] on one line.
+        handle.write(close if prefix is separator or not pretty else b"]\n}")
+
+    @staticmethod
+    def _write_bundle_streaming(
+        resources: Iterable[Dict], path: Path, bundle_type: str = "collection", pretty: bool = False
+    ) -> None:
+        """Stream :meth:`bundle` output for ``resources`` to ``path``.
+
+        See :meth:`_write_bundle_entries`. The file is written next to ``path``
+        and renamed into place once complete.
+        """
+
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        with open(tmp_path, "wb", buffering=WRITE_BUFFER_SIZE) as handle:
+            FHIRDataGenerator._write_bundle_entries(handle, resources, bundle_type, pretty=pretty)
+        os.replace(tmp_path, path)
+
+    def export_patient_folder(
+        self, resources: List[Dict], output_dir: Path, pretty: bool = False, skip_mkdir: bool = False
+    ) -> List[Dict]:
+        """Persist a single patient's resources and bundle to disk.
+
+        Args:
+            resources: The patient's resources.
+            output_dir: Folder receiving one JSON file per resource plus ``bundle.json``.
+            pretty: Indent JSON for human readers; compact output is smaller and faster.
+            skip_mkdir: Set when the caller has already created ``output_dir``.
+
+        Returns:
+            The resources that passed validation and were written.
+        """
+
+        if not skip_mkdir:
+            output_dir.mkdir(parents=True, exist_ok=True)
         validated_resources: List[Dict] = []
         for resource in resources:
             if not validate_resource(resource):
                 LOGGER.warning("Skipping invalid resource %s", resource.get("id"))
                 continue
-            filename = output_dir / f"{resource['resourceType'].lower()}_{resource['id']}.json"
-            filename.write_text(json.dumps(resource, indent=2))
+            filename = output_dir / resource_filename(resource)
+            filename.write_bytes(dumps_json(resource, pretty=pretty))
             validated_resources.append(resource)
             LOGGER.debug("Wrote %s", filename)
 
         bundle_path = output_dir / "bundle.json"
-        bundle_path.write_text(json.dumps(self.bundle(validated_resources), indent=2))
+        write_json(bundle_path, self.bundle(validated_resources), pretty=pretty)
         LOGGER.info("Saved bundle to %s", bundle_path)
+        return validated_resources
+
+    def export_dataset(self, dataset: Iterable[List[Dict]], output_root: Path, pretty: bool = False) -> None:
+        """Persist a full dataset of patient folders and a consolidated bundle.
 
-    def export_dataset(self, dataset: List[List[Dict]], output_root: Path) -> None:
-        """Persist a full dataset of patient folders and a consolidated bundle."""
+        ``dataset`` is consumed in a single pass, so a lazy :meth:`iter_dataset`
+        works as well as a list; the consolidated bundle is streamed to disk as
+        each patient is exported rather than assembled in memory. JSON is compact
+        unless ``pretty`` is set.
+        """
 
         output_root.mkdir(parents=True, exist_ok=True)
-        for idx, resources in enumerate(dataset, start=1):
-            patient_folder = output_root / f"patient_{idx:03d}"
-            self.export_patient_folder(resources, patient_folder)
+
+        def exported_resources() -> Iterator[Dict]:
+            for idx, resources in enumerate(dataset, start=1):
+                patient_folder = output_root / f"patient_{idx:03d}"
+                # The root exists, so a single mkdir replaces the parents=True walk.
+                patient_folder.mkdir(exist_ok=True)
+                yield from self.export_patient_folder(resources, patient_folder, pretty=pretty, skip_mkdir=True)
 
         bundle_file = output_root / "synthetic_bundle.json"
-        all_resources = [
-            resource for patient_resources in dataset for resource in patient_resources if validate_resource(resource)
-        ]
-        bundle_file.write_text(json.dumps(self.bundle(all_resources), indent=2))
+        self._write_bundle_streaming(exported_resources(), bundle_file, pretty=pretty)
+        fsync_directory(output_root)
         LOGGER.info("Saved dataset bundle to %s", bundle_file)
 
+    def export_dataset_archive(self, dataset: Iterable[List[Dict]], output_path: Path, pretty: bool = False) -> None:
+        """Write the :meth:`export_dataset` layout into a single zip archive.
+
+        This is the fast path for large datasets: one file handle replaces the
+        per-resource file creates, and JSON compresses well at the lowest level.
+        Like :meth:`export_dataset`, ``dataset`` is consumed in a single pass and
+        the consolidated bundle is streamed rather than assembled in memory.
+        """
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with (
+            zipfile.ZipFile(output_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as archive,
+            tempfile.TemporaryFile(buffering=WRITE_BUFFER_SIZE) as spool,
+        ):
+
+            def exported_resources() -> Iterator[Dict]:
+                for idx, resources in enumerate(dataset, start=1):
+                    folder = f"patient_{idx:03d}"
+                    validated_resources: List[Dict] = []
+                    for resource in resources:
+                        if not validate_resource(resource):
+                            LOGGER.warning("Skipping invalid resource %s", resource.get("id"))
+                            continue
+                        archive.writestr(f"{folder}/{resource_filename(resource)}", dumps_json(resource, pretty=pretty))
+                        validated_resources.append(resource)
+                    archive.writestr(
+                        f"{folder}/bundle.json", dumps_json(self.bundle(validated_resources), pretty=pretty)
+                    )
+                    yield from validated_resources
+
+            # A zip accepts no other writes while a member is open, so the
+            # consolidated bundle is spooled to disk and copied in at the end.
+            self._write_bundle_entries(spool, exported_resources(), pretty=pretty)
+            size = spool.tell()
+            spool.seek(0)
+            with archive.open("synthetic_bundle.json", "w", force_zip64=size > zipfile.ZIP64_LIMIT) as member:
+                shutil.copyfileobj(spool, member, WRITE_BUFFER_SIZE)
+        LOGGER.info("Saved dataset archive to %s", output_path)
+
     @staticmethod
-    def export_csv_summary(dataset: List[List[Dict]], output_file: Path) -> None:
-        """Emit a CSV summary of core demographics and vitals."""
-
-        rows: List[Dict[str, str]] = []
-        for resources in dataset:
-            patient = next((res for res in resources if res.get("resourceType") == "Patient"), None)
-            encounter = next((res for res in resources if res.get("resourceType") == "Encounter"), None)
-            observation_map = {
-                res.get("code", {}).get("text"): res for res in resources if res.get("resourceType") == "Observation"
-            }
-            if not patient or not encounter:
-                continue
+    def export_ndjson(dataset: Iterable[List[Dict]], output_file: Path) -> int:
+        """Stream every valid resource into one newline-delimited JSON file.
 
-            rows.append(
-                {
-                    "patient_id": patient["id"],
-                    "birth_date": patient.get("birthDate", ""),
-                    "gender": patient.get("gender", ""),
-                    "encounter_type": encounter.get("class", {}).get("display", ""),
-                    "heart_rate": observation_map.get("Heart rate", {}).get("valueQuantity", {}).get("value", ""),
-                    "blood_pressure_systolic": next(
-                        (
-                            comp.get("valueQuantity", {}).get("value", "")
-                            for comp in observation_map.get("Blood pressure panel", {}).get("component", [])
-                            if comp.get("code", {}).get("text") == "Systolic blood pressure"
-                        ),
-                        "",
-                    ),
-                }
-            )
+        Returns:
+            The number of resources written.
+        """
+
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        written = 0
+        with output_file.open("wb", buffering=WRITE_BUFFER_SIZE) as handle:
+            for resources in dataset:
+                for resource in resources:
+                    if not validate_resource(resource):
+                        LOGGER.warning("Skipping invalid resource %s", resource.get("id"))
+                        continue
+                    handle.write(dumps_json(resource, pretty=False))
+                    handle.write(b"\n")
+                    written += 1
+        LOGGER.info("Saved %d resources to %s", written, output_file)
+        return written
+
+    @staticmethod
+    def summary_row(resources: List[Dict]) -> Optional[Tuple[Any, ...]]:
+        """Return the CSV summary row for one patient, or ``None`` if incomplete.
+
+        Values follow the column order of ``CSV_SUMMARY_FIELDS``.
+        """
+
+        patient = encounter = None
+        observation_map: Dict[str, Dict] = {}
+        for res in resources:
+            resource_type = res.get("resourceType")
+            if resource_type == "Observation":
+                observation_map[res.get("code", _EMPTY).get("text")] = res
+            elif resource_type == "Patient" and patient is None:
+                patient = res
+            elif resource_type == "Encounter" and encounter is None:
+                encounter = res
+        if not patient or not encounter:
+            return None
+
+        return (
+            patient["id"],
+            patient.get("birthDate", ""),
+            patient.get("gender", ""),
+            encounter.get("class", _EMPTY).get("display", ""),
+            observation_map.get("Heart rate", _EMPTY).get("valueQuantity", _EMPTY).get("value", ""),
+            next(
+                (
+                    comp.get("valueQuantity", _EMPTY).get("value", "")
+                    for comp in observation_map.get("Blood pressure panel", _EMPTY).get("component", ())
+                    if comp.get("code", _EMPTY).get("text") == "Systolic blood pressure"
+                ),
+                "",
+            ),
+        )
+
+    @classmethod
+    def export_csv_summary(cls, dataset: Iterable[List[Dict]], output_file: Path) -> None:
+        """Emit a CSV summary of core demographics and vitals.
+
+        Rows are streamed into the writer as patients are summarized.
+        """
+
+        rows = (row for row in map(cls.summary_row, dataset) if row is not None)
+        cls.write_csv_summary(rows, output_file)
+
+    @staticmethod
+    def write_csv_summary(rows: Iterable[Tuple[Any, ...]], output_file: Path) -> None:
+        """Write :meth:`summary_row` rows to ``output_file``."""
 
-        if not rows:
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
             LOGGER.warning("No patient rows available for CSV export")
             output_file.write_text("")
             return
 
         output_file.parent.mkdir(parents=True, exist_ok=True)
         with output_file.open("w", newline="") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=list(rows[0].keys()))
-            writer.writeheader()
+            writer = csv.writer(csvfile)
+            writer.writerow(CSV_SUMMARY_FIELDS)
+            writer.writerow(first)
             writer.writerows(rows)
         LOGGER.info("Saved CSV summary to %s", output_file)
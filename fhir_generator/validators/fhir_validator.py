@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any, Dict, Iterable
+from typing import Any, Callable, Dict, Iterable, Tuple
 
 LOGGER = logging.getLogger(__name__)
 
@@ -24,41 +24,111 @@ REQUIRED_FIELDS = {
 }
 
 
-def validate_resource(resource: Dict[str, Any]) -> bool:
-    """Validate a single resource for structural completeness."""
+RESOURCE_TYPES_LOWER = {resource_type: resource_type.lower() for resource_type in REQUIRED_FIELDS}
+
+_REQUIRED = {resource_type: tuple(fields) for resource_type, fields in REQUIRED_FIELDS.items()}
+_DEFAULT_REQUIRED = ("resourceType", "id")
+_REFERENCE_FIELDS = ("subject", "patient", "encounter")
+_ABSENT = object()
 
-    resource_type = resource.get("resourceType")
-    if not resource_type:
-        LOGGER.error("Missing resourceType in %s", resource)
-        return False
 
-    required = REQUIRED_FIELDS.get(resource_type, ["resourceType", "id"])
-    missing = [field for field in required if field not in resource]
-    if missing:
-        LOGGER.error("Resource %s missing required fields: %s", resource_type, ", ".join(missing))
+def _report_missing(resource: Dict[str, Any], resource_type: str, required: Tuple[str, ...]) -> bool:
+    missing = [name for name in required if name not in resource]
+    LOGGER.error("Resource %s missing required fields: %s", resource_type, ", ".join(missing))
+    return False
+
+
+def _check_reference(resource_type: str, reference_field: str, reference: Any) -> bool:
+    if not isinstance(reference, dict) or "reference" not in reference:
+        LOGGER.error("Resource %s has invalid reference in %s", resource_type, reference_field)
+        return False
+    if not REFERENCE_PATTERN.fullmatch(reference["reference"]):
+        LOGGER.error("Resource %s reference %s is not in <Type>/<id> form", resource_type, reference_field)
         return False
+    return True
+
+
+def _validate_generic(resource: Dict[str, Any], resource_type: str) -> bool:
+    required = _REQUIRED.get(resource_type, _DEFAULT_REQUIRED)
+    for field in required:
+        if field not in resource:
+            return _report_missing(resource, resource_type, required)
 
     if "id" in resource and not resource["id"]:
         LOGGER.error("Resource %s has empty id", resource_type)
         return False
 
-    for reference_field in ("subject", "patient", "encounter"):
-        if reference_field in resource:
-            reference = resource[reference_field]
-            if not isinstance(reference, dict) or "reference" not in reference:
-                LOGGER.error("Resource %s has invalid reference in %s", resource_type, reference_field)
-                return False
-            if not REFERENCE_PATTERN.match(reference.get("reference", "")):
-                LOGGER.error("Resource %s reference %s is not in <Type>/<id> form", resource_type, reference_field)
-                return False
+    for reference_field in _REFERENCE_FIELDS:
+        reference = resource.get(reference_field, _ABSENT)
+        if reference is not _ABSENT and not _check_reference(resource_type, reference_field, reference):
+            return False
 
     return True
 
 
+def _compile_validator(resource_type: str, required: Tuple[str, ...]) -> Callable[[Dict[str, Any]], bool]:
+    """Generate a straight-line validator equivalent to :func:`_validate_generic` for one type.
+
+    Required-field membership tests and reference checks are unrolled; any
+    failure defers to the shared helpers so error logging stays identical.
+    """
+
+    # Chained ``in`` tests beat both a keys() bitmask and a frozenset subset
+    # check here: each is one C-level dict lookup with no per-key loop body.
+    missing_test = " or ".join(f"{field!r} not in resource" for field in required)
+    lines = [
+        "def validator(resource):",
+        f"    if {missing_test}:",
+        f"        return _report_missing(resource, {resource_type!r}, {required!r})",
+    ]
+    if "id" in required:
+        lines += [
+            '    if not resource["id"]:',
+            f'        _LOGGER.error("Resource %s has empty id", {resource_type!r})',
+            "        return False",
+        ]
+    for field in _REFERENCE_FIELDS:
+        lines.append(f"    reference = resource.get({field!r}, _ABSENT)")
+        fast_ok = 'isinstance(reference, dict) and "reference" in reference and _match(reference["reference"])'
+        guard = f"not ({fast_ok})" if field in required else f"reference is not _ABSENT and not ({fast_ok})"
+        lines += [
+            f"    if {guard} and not _check_reference({resource_type!r}, {field!r}, reference):",
+            "        return False",
+        ]
+    lines.append("    return True")
+
+    namespace: Dict[str, Any] = {
+        "_ABSENT": _ABSENT,
+        "_LOGGER": LOGGER,
+        "_check_reference": _check_reference,
+        "_match": REFERENCE_PATTERN.fullmatch,
+        "_report_missing": _report_missing,
+    }
+    exec("\n".join(lines), namespace)  # source is built from the static REQUIRED_FIELDS table
+    return namespace["validator"]
+
+
+_VALIDATORS = {resource_type: _compile_validator(resource_type, fields) for resource_type, fields in _REQUIRED.items()}
+
+
+def validate_resource(resource: Dict[str, Any]) -> bool:
+    """Validate a single resource for structural completeness."""
+
+    resource_type = resource.get("resourceType")
+    if not resource_type:
+        LOGGER.error("Missing resourceType in %s", resource)
+        return False
+
+    validator = _VALIDATORS.get(resource_type)
+    if validator is None:
+        return _validate_generic(resource, resource_type)
+    return validator(resource)
+
+
 def validate_collection(resources: Iterable[Dict[str, Any]]) -> bool:
-    """Validate multiple resources, returning True only if all pass."""
+    """Validate multiple resources, returning True only if all pass.
+
+    Stops at the first invalid resource, which has already been logged.
+    """
 
-    valid = True
-    for res in resources:
-        valid = validate_resource(res) and valid
-    return valid
+    return all(map(validate_resource, resources))
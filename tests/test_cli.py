@@ -1,9 +1,11 @@
 import json
+import zipfile
 from pathlib import Path
 
 import pytest
 
-from fhir_generator.cli import load_resources_from_dir
+from fhir_generator import main as main_module
+from fhir_generator.cli import load_resources_from_dir, main
 from fhir_generator.main import FHIRDataGenerator
 
 
@@ -37,3 +39,108 @@ def test_export_csv_summary(tmp_path: Path) -> None:
     contents = csv_path.read_text().splitlines()
     assert contents[0].startswith("patient_id")
     assert len(contents) == 2
+
+
+def test_load_resources_skips_invalid_json(tmp_path: Path) -> None:
+    (tmp_path / "broken.json").write_text("{not json")
+    (tmp_path / "patient.json").write_text(json.dumps({"resourceType": "Patient", "id": "1"}))
+
+    resources = load_resources_from_dir(tmp_path)
+    assert [res["id"] for res in resources] == ["1"]
+
+
+def test_create_patient_writes_json(tmp_path: Path) -> None:
+    output = tmp_path / "patient.json"
+    main(["create-patient", "--seed", "3", "--output", str(output)])
+
+    assert json.loads(output.read_text())["resourceType"] == "Patient"
+
+
+def test_generate_dataset_parallel_splits_work() -> None:
+    generator = FHIRDataGenerator(seed=9)
+    dataset = generator.generate_dataset(5, workers=2)
+
+    assert len(dataset) == 5
+    ids = [res["id"] for resources in dataset for res in resources]
+    assert len(ids) == len(set(ids))
+    mrns = [
+        res["identifier"][0]["value"] for resources in dataset for res in resources if res["resourceType"] == "Patient"
+    ]
+    assert len(set(mrns)) == 5
+
+
+def test_ndjson_dataset_round_trips_through_bundle(tmp_path: Path) -> None:
+    main(["create-dataset", "--count", "2", "--seed", "4", "--ndjson", "--output", str(tmp_path / "out")])
+    ndjson_file = tmp_path / "out" / "resources.ndjson"
+    lines = ndjson_file.read_text().splitlines()
+
+    resources = load_resources_from_dir(tmp_path / "out")
+    assert len(resources) == len(lines) > 0
+    assert not list((tmp_path / "out").glob("patient_*"))
+
+
+def test_iter_dataset_validates_count_eagerly() -> None:
+    generator = FHIRDataGenerator()
+    with pytest.raises(ValueError):
+        generator.iter_dataset(0)
+
+
+def test_parallel_dataset_is_independent_of_worker_count() -> None:
+    def names(workers: int) -> list:
+        dataset = FHIRDataGenerator(seed=21).generate_dataset(6, workers=workers)
+        return [res["name"] for resources in dataset for res in resources if res["resourceType"] == "Patient"]
+
+    assert names(2) == names(3)
+
+
+def test_parallel_datasets_continue_the_seeded_stream() -> None:
+    def patients(generator: FHIRDataGenerator) -> list:
+        dataset = generator.generate_dataset(4, workers=2)
+        return [
+            (res["name"], res["identifier"][0]["value"])
+            for resources in dataset
+            for res in resources
+            if res["resourceType"] == "Patient"
+        ]
+
+    generator = FHIRDataGenerator(seed=7)
+    first = patients(generator)
+    second = patients(generator)
+
+    assert all(a[0] != b[0] and a[1] != b[1] for a, b in zip(first, second))
+
+    reseeded = FHIRDataGenerator()
+    reseeded.set_seed(42)
+    expected = patients(reseeded)
+    reseeded.set_seed(42)
+    assert patients(reseeded) == expected
+
+
+def test_parallel_dataset_refills_bounded_window(monkeypatch: pytest.MonkeyPatch) -> None:
+    def names() -> list:
+        dataset = FHIRDataGenerator(seed=4).generate_dataset(7, workers=2)
+        return [res["name"] for resources in dataset for res in resources if res["resourceType"] == "Patient"]
+
+    expected = names()
+    monkeypatch.setattr(main_module, "PARALLEL_CHUNK_SIZE", 1)
+    monkeypatch.setattr(main_module, "PARALLEL_TASKS_PER_WORKER", 1)
+
+    assert len(expected) == 7
+    assert names() == expected
+
+
+def test_export_dataset_archive(tmp_path: Path) -> None:
+    generator = FHIRDataGenerator(seed=8)
+    archive_path = tmp_path / "dataset.zip"
+
+    dataset = generator.generate_dataset(2)
+    generator.export_dataset_archive(dataset, archive_path)
+    generator.export_dataset(dataset, tmp_path / "folders")
+
+    with zipfile.ZipFile(archive_path) as archive:
+        names = archive.namelist()
+        raw_bundle = archive.read("synthetic_bundle.json")
+    bundle = json.loads(raw_bundle)
+    assert "patient_002/bundle.json" in names
+    assert len(bundle["entry"]) == len(names) - 3
+    assert raw_bundle == (tmp_path / "folders" / "synthetic_bundle.json").read_bytes()
@@ -1,4 +1,8 @@
+import pytest
+
+from fhir_generator import main as main_module
 from fhir_generator.generators.observation import OBSERVATION_TYPES
+from fhir_generator.generators.utils import PresampledVitals, observation_value
 from fhir_generator.main import FHIRDataGenerator
 
 
@@ -14,3 +18,43 @@ def test_observation_values_align() -> None:
         assert obs.get("encounter")
 
     assert len(observations) == len(OBSERVATION_TYPES)
+
+
+def test_presampled_vitals_are_deterministic() -> None:
+    first = PresampledVitals(3, seed=11)
+    second = PresampledVitals(3, seed=11)
+
+    assert first.for_patient(2) == second.for_patient(2)
+    assert set(first.for_patient(0)) == set(OBSERVATION_TYPES)
+    assert len(first.for_patient(0)["blood_pressure"]) == 2
+
+
+def test_observation_value_uses_presampled_draws() -> None:
+    value = observation_value("blood_pressure", (131.7, 84.2))
+
+    assert [comp["valueQuantity"]["value"] for comp in value["component"]] == [131, 84]
+
+
+def test_repeated_datasets_continue_the_vitals_stream() -> None:
+    def vitals(dataset):
+        return [res["valueQuantity"] for patient in dataset for res in patient if "valueQuantity" in res]
+
+    generator = FHIRDataGenerator(seed=3)
+    first = vitals(generator.generate_dataset(2))
+
+    assert vitals(generator.generate_dataset(2)) != first
+    assert vitals(FHIRDataGenerator(seed=3).generate_dataset(2)) == first
+
+
+def test_vitals_are_presampled_in_blocks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(main_module, "VITALS_BLOCK_SIZE", 2)
+
+    def vitals() -> list:
+        dataset = FHIRDataGenerator(seed=9).generate_dataset(5)
+        return [[res["valueQuantity"] for res in patient if "valueQuantity" in res] for patient in dataset]
+
+    first = vitals()
+
+    assert len(first) == 5
+    assert first[0] != first[2] != first[4]
+    assert vitals() == first
@@ -1,5 +1,8 @@
+import json
 from pathlib import Path
 
+from fhir_generator.generators.patient import next_mrn, reset_mrn_counter
+from fhir_generator.generators.utils import build_reference
 from fhir_generator.main import FHIRDataGenerator
 
 
@@ -11,8 +14,36 @@ def test_generate_single_patient(tmp_path: Path) -> None:
     assert patient["resourceType"] == "Patient"
     assert patient["gender"] in {"male", "female", "other"}
 
-    generator.export_patient_folder(resources, tmp_path)
+    written = generator.export_patient_folder(resources, tmp_path)
     assert (tmp_path / "bundle.json").exists()
+    assert written == resources
+
+
+def test_same_seed_reproduces_patients() -> None:
+    def patients(generator):
+        dataset = generator.generate_dataset(2)
+        return [
+            {key: value for key, value in res.items() if key != "id"}
+            for resources in dataset
+            for res in resources
+            if res["resourceType"] == "Patient"
+        ]
+
+    first = patients(FHIRDataGenerator(seed=5))
+
+    assert patients(FHIRDataGenerator(seed=5)) == first
+
+
+def test_references_are_not_shared_between_resources() -> None:
+    resources = FHIRDataGenerator(seed=3).generate_patient_resources()
+    observation = next(res for res in resources if res["resourceType"] == "Observation")
+    condition = next(res for res in resources if res["resourceType"] == "Condition")
+    expected = dict(condition["subject"])
+
+    observation["subject"]["reference"] = "Patient/zzz"
+
+    assert condition["subject"] == expected
+    assert build_reference("Patient", expected["reference"].split("/")[1]) == expected
 
 
 def test_bundle_creation() -> None:
@@ -22,3 +53,32 @@ def test_bundle_creation() -> None:
 
     assert bundle["resourceType"] == "Bundle"
     assert len(bundle["entry"]) == len(resources)
+
+
+def test_streamed_dataset_bundle_matches_bundle(tmp_path: Path) -> None:
+    generator = FHIRDataGenerator(seed=12)
+    dataset = generator.generate_dataset(2)
+
+    generator.export_dataset(dataset, tmp_path)
+
+    streamed = json.loads((tmp_path / "synthetic_bundle.json").read_text())
+    assert streamed == generator.bundle([res for resources in dataset for res in resources])
+
+
+def test_bundle_assigns_full_url_for_missing_ids() -> None:
+    bundle = FHIRDataGenerator.bundle([{"resourceType": "Patient", "id": "p1"}, {"resourceType": "Patient", "id": ""}])
+
+    assert bundle["entry"][0]["fullUrl"] == "urn:uuid:p1"
+    assert len(bundle["entry"][1]["fullUrl"]) == len("urn:uuid:") + 36
+
+
+def test_mrn_keeps_seven_characters_past_counter_limit() -> None:
+    reset_mrn_counter(99_999)
+    try:
+        last, wrapped = next_mrn(), next_mrn()
+    finally:
+        reset_mrn_counter()
+
+    assert last.endswith("99999")
+    assert wrapped.endswith("00000")
+    assert len(last) == len(wrapped) == 7
@@ -0,0 +1,90 @@
+import random
+import uuid
+
+from faker import Faker
+
+from fhir_generator.generators.utils import (
+    CODED_CONCEPTS,
+    CODING_SYSTEMS,
+    PooledFaker,
+    WeightedPicker,
+    batch_now,
+    batch_now_iso,
+    coded_text,
+    freeze_now,
+    new_uuid,
+    pick_weighted,
+)
+
+
+def test_coded_text_is_cached() -> None:
+    concept = coded_text("http://loinc.org", "8867-4", "Heart rate")
+
+    assert concept is coded_text("http://loinc.org", "8867-4", "Heart rate")
+    assert concept == {
+        "coding": [{"system": "http://loinc.org", "code": "8867-4", "display": "Heart rate"}],
+        "text": "Heart rate",
+    }
+
+
+def test_coded_concepts_match_coding_systems() -> None:
+    for key, concepts in CODED_CONCEPTS.items():
+        assert [concept["coding"][0] for concept in concepts] == CODING_SYSTEMS[key]
+
+
+def test_new_uuid_is_version_4() -> None:
+    values = {new_uuid() for _ in range(5000)}
+
+    assert len(values) == 5000
+    for value in values:
+        parsed = uuid.UUID(value)
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
+        assert str(parsed) == value
+
+
+def test_freeze_now_pins_timestamps() -> None:
+    with freeze_now() as now:
+        assert batch_now() is now
+        assert batch_now_iso() == now.isoformat()
+        with freeze_now() as inner:
+            assert inner is now
+        assert batch_now() is now
+
+    assert batch_now() is not now
+
+
+def test_weighted_picker_respects_zero_weights() -> None:
+    picker = WeightedPicker({"never": 0.0, "always": 2.5, "also_never": 0.0})
+
+    assert {picker.pick() for _ in range(200)} == {"always"}
+    assert pick_weighted({"only": 1}) == "only"
+
+
+def test_weighted_pick_with_all_zero_weights_returns_first_key() -> None:
+    weights = {"first": 0.0, "second": 0.0, "third": 0.0}
+
+    assert pick_weighted(weights) == "first"
+    assert WeightedPicker(weights).pick() == "first"
+
+
+def test_weighted_picker_matches_pick_weighted() -> None:
+    weights = {"a": 1.0, "b": 0.0, "c": 3.5, "d": 2.0}
+    picker = WeightedPicker(weights)
+
+    random.seed(17)
+    expected = [pick_weighted(weights) for _ in range(500)]
+    random.seed(17)
+    assert [picker.pick() for _ in range(500)] == expected
+
+
+def test_pooled_faker_recycles_after_pool_fills() -> None:
+    fake = PooledFaker(Faker(), pool_size=3)
+    fake.seed_instance(7)
+
+    first = [fake.first_name() for _ in range(3)]
+    assert all(fake.first_name() in first for _ in range(20))
+    assert fake.word()
+
+    fake.seed_instance(7)
+    assert [fake.first_name() for _ in range(3)] == first
@@ -24,3 +24,49 @@ def test_validate_collection_handles_multiple() -> None:
     }
 
     assert validate_collection([patient, encounter]) is True
+
+
+def test_validate_collection_stops_at_first_failure() -> None:
+    seen = []
+
+    def resources():
+        for resource in ({"resourceType": "Patient", "id": "p1"}, {"resourceType": "Patient", "id": "p2"}):
+            seen.append(resource["id"])
+            yield resource
+
+    assert validate_collection(resources()) is False
+    assert seen == ["p1"]
+
+
+def test_validate_resource_rejects_null_reference_and_reports_missing() -> None:
+    condition = {"resourceType": "Condition", "id": "c1", "code": {"text": "demo"}, "subject": None}
+
+    assert validate_resource(condition) is False
+    assert validate_resource({"resourceType": "Patient", "id": "p1"}) is False
+
+
+def test_validate_resource_rejects_reference_with_trailing_newline() -> None:
+    resource = {
+        "resourceType": "Condition",
+        "id": "c1",
+        "code": {"text": "demo"},
+        "subject": {"reference": "Patient/1\n"},
+    }
+
+    assert validate_resource(resource) is False
+
+
+def test_generated_validators_match_generic_rules() -> None:
+    encounter = {
+        "resourceType": "Encounter",
+        "id": "2",
+        "status": "finished",
+        "class": {"code": "AMB"},
+        "subject": {"reference": "Patient/1"},
+    }
+
+    assert validate_resource(encounter) is True
+    assert validate_resource({**encounter, "encounter": {"reference": "Encounter/3"}}) is True
+    assert validate_resource({**encounter, "patient": "Patient/1"}) is False
+    assert validate_resource({**encounter, "id": ""}) is False
+    assert validate_resource({key: value for key, value in encounter.items() if key != "class"}) is False